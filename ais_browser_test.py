@@ -7,15 +7,34 @@ enable the AIS layer, and monitor network requests to identify failures.
 
 Requirements:
     pip install selenium requests beautifulsoup4
+    pip install websocket-client  # optional, push-based network capture
+    pip install orjson            # optional, faster JSON parsing and reports
     
 Also requires Chrome/Chromium and chromedriver installed.
+
+After a successful browser run the AIS API calls made by the map are recorded
+in a small on-disk cache, and later runs replay them directly over HTTP
+instead of starting Chrome (use --no-cache to force the browser path).
 """
 
+import os
+import re
+import copy
+import base64
 import sys
+import atexit
+import queue
+import shutil
+import tempfile
+import threading
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
 import json
 import time
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Iterable, Iterator, Tuple
+from urllib.parse import urlparse, parse_qsl
+from urllib.request import urlopen
 
 try:
     from selenium import webdriver
@@ -23,37 +42,372 @@ try:
     from selenium.webdriver.support.ui import WebDriverWait
     from selenium.webdriver.support import expected_conditions as EC
     from selenium.webdriver.chrome.options import Options
-    from selenium.common.exceptions import TimeoutException, NoSuchElementException
+    from selenium.common.exceptions import TimeoutException, WebDriverException
 except ImportError:
     print("ERROR: Selenium not installed. Install with: pip install selenium")
     sys.exit(1)
 
+try:
+    import requests
+except ImportError:
+    requests = None  # Cached replay unavailable; always use the browser
+
+try:
+    import websocket  # websocket-client
+except ImportError:
+    websocket = None  # Network capture falls back to the performance log
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Falls back to the stdlib json module
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch one type
+json_loads = orjson.loads if orjson else json.loads
+
+
+def json_dumps_pretty(data) -> bytes:
+    """Serialize a report as indented UTF-8 JSON"""
+    if orjson:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2).encode('utf-8')
+
+
+OPENSEAMAP_URL = "https://map.openseamap.org"
+CACHE_DIR = os.path.expanduser('~/.cache/openseamap_ais')
+
+# Request headers kept when a call is cached for replay; anything that could
+# carry credentials (Authorization, Cookie, API keys) is never written to disk
+REPLAY_HEADERS = frozenset({'accept', 'accept-language', 'referer', 'user-agent',
+                            'x-requested-with'})
+
+# URL keywords marking a request (or response) as AIS-related
+AIS_REQUEST_KEYWORDS = ('ais', 'marine', 'traffic', 'ship', 'vessel',
+                        'getais', 'marinetraffic', 'aishub', 'aisstream')
+AIS_RESPONSE_KEYWORDS = ('ais', 'marine', 'traffic', 'ship', 'vessel')
+
+def is_tracked_network_event(raw: str) -> bool:
+    """Cheap pre-parse check for the CDP events capture_network_logs handles"""
+    return ('"Network.requestWillBeSent"' in raw
+            or '"Network.responseReceived"' in raw
+            or '"Network.loadingFailed"' in raw)
+
+
+def parse_performance_log(logs: List[Dict]) -> Iterator[Tuple[str, Dict]]:
+    """Yield (method, params) for the tracked events in a performance-log batch"""
+    for log in logs:
+        # Skip the bulk of events without parsing them
+        raw = log['message']
+        if not is_tracked_network_event(raw):
+            continue
+        try:
+            message = json_loads(raw)['message']
+            yield message['method'], message['params']
+        except (ValueError, KeyError):
+            continue
+
+
+# Where the AIS checkbox may live; probed together as one XPath union
+AIS_CHECKBOX_XPATHS = (
+    "//input[@type='checkbox' and contains(@id, 'Ais')]",
+    "//label[contains(text(), 'Marine Traffic')]/../input",
+    "//label[contains(text(), 'AIS')]/../input",
+)
+
+# Content with no bearing on the AIS layer, blocked to shorten page load. Plain
+# *.png is deliberately absent: AIS overlays may themselves be PNG tiles.
+BLOCKED_URL_PATTERNS = (
+    '*.jpg', '*.jpeg', '*.webp', '*.woff', '*.woff2',
+    '*google-analytics*', '*googletagmanager*', '*doubleclick*',
+    '*tile.openstreetmap.org/*',
+)
+
+# HTTP status classification: STATUS_BOUNDS[i] is the lowest status in
+# STATUS_CLASSES[i]; 401/403 mean the AIS backend refused us
+STATUS_BOUNDS = (0, 200, 300, 401, 402, 403, 404)
+STATUS_CLASSES = ('failed', 'successful', 'failed', 'blocked', 'failed', 'blocked', 'failed')
+
+MAX_FINDINGS = 5  # Findings formatted per report; the rest are only counted
+
+# True once OpenSeaMap's OpenLayers map object exists
+MAP_READY_SCRIPT = ("return typeof window.map !== 'undefined' && "
+                    "typeof window.OpenLayers !== 'undefined';")
+
+SELECTOR_TYPES = {"ID": By.ID, "CSS": By.CSS_SELECTOR, "XPATH": By.XPATH}
+SELECTOR_CACHE_FILE = os.path.join(CACHE_DIR, 'selectors.json')
+
+
+def _load_cache_json(path: str) -> Dict:
+    """Read a JSON cache file, treating a missing or corrupt file as empty"""
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+_CACHE_LOCK = threading.Lock()
+
+
+def _save_cache_json(path: str, data: Dict):
+    """Write a JSON cache file, warning instead of failing the run"""
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with _CACHE_LOCK, open(path, 'w') as f:
+            json.dump(data, f, indent=2)
+    except OSError as e:
+        print(f"Warning: Could not save cache {path}: {e}")
+
+
+def _build_opts() -> Options:
+    """Chrome options shared by every diagnostic browser"""
+    chrome_options = Options()
+    chrome_options.add_argument('--no-sandbox')
+    chrome_options.add_argument('--disable-dev-shm-usage')
+    chrome_options.add_argument('--disable-blink-features=AutomationControlled')
+    
+    # Trim renderer and browser work that plays no part in the diagnostic
+    chrome_options.add_argument('--disable-gpu')
+    chrome_options.add_argument('--mute-audio')
+    chrome_options.add_argument('--disable-background-networking')
+    chrome_options.add_argument('--disable-renderer-backgrounding')
+    chrome_options.add_experimental_option('prefs', {
+        'profile.default_content_setting_values.notifications': 2,
+    })
+    
+    return chrome_options
+
+
+_BASE_OPTS = _build_opts()
+
+
+def _perf_log_opts() -> Options:
+    """Options for a browser that records network events in the performance log
+    
+    Only needed when the CDP WebSocket can't be used; otherwise chromedriver
+    would buffer (and re-serialize) every event for nothing.
+    """
+    chrome_options = copy.deepcopy(_BASE_OPTS)
+    # Only the Network domain is needed, so skip Page lifecycle events
+    chrome_options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+    chrome_options.add_experimental_option('perfLoggingPrefs', {
+        'enableNetwork': True,
+        'enablePage': False,
+    })
+    return chrome_options
+
+# Idle Chrome sessions, keyed by the options they were started with, and the
+# profile slots held by live browsers of each key (each browser needs its own
+# profile directory; a slot is freed again when its browser is quit)
+_POOL: Dict[frozenset, List["webdriver.Chrome"]] = {}
+_POOL_SLOTS: Dict[frozenset, set] = {}
+_POOL_LOCK = threading.Lock()
+
+
+def _reuse_driver(driver: "webdriver.Chrome") -> bool:
+    """Move an idle browser onto a fresh tab; False if the browser has died"""
+    try:
+        old_tab = driver.current_window_handle
+        driver.switch_to.new_window('tab')
+        new_tab = driver.current_window_handle
+        driver.switch_to.window(old_tab)
+        driver.close()
+        driver.switch_to.window(new_tab)
+        return True
+    except WebDriverException:
+        _quit_driver(driver)
+        return False
+
+
+def acquire_driver(chrome_options: Options, profile_dir: str) -> "webdriver.Chrome":
+    """Return a pooled Chrome session on a fresh tab, starting Chrome only if none is idle
+    
+    A new browser gets `profile_dir` (or `profile_dir-N` when N browsers with
+    the same options are already running) as its persistent profile. If
+    another process already holds that profile, a throwaway one is used.
+    Idle browsers that died while pooled are discarded.
+    """
+    # Browsers with and without the performance log are pooled separately
+    key = frozenset(chrome_options.arguments).union(
+        chrome_options.capabilities.get('goog:loggingPrefs', {}))
+    while True:
+        with _POOL_LOCK:
+            idle = _POOL.get(key)
+            driver = idle.pop() if idle else None
+            if driver is None:
+                used = _POOL_SLOTS.setdefault(key, set())
+                slot = next(i for i in range(len(used) + 1) if i not in used)
+                used.add(slot)
+        if driver is None:
+            break
+        if _reuse_driver(driver):
+            return driver
+    
+    try:
+        driver = _start_driver(chrome_options, f"{profile_dir}-{slot}" if slot else profile_dir)
+    except Exception:
+        with _POOL_LOCK:
+            _POOL_SLOTS[key].discard(slot)
+        raise
+    driver.pool_key = key
+    driver.pool_slot = slot
+    driver.perf_log = 'goog:loggingPrefs' in chrome_options.capabilities
+    return driver
+
+
+def _start_driver(chrome_options: Options, profile_dir: str) -> "webdriver.Chrome":
+    """Start Chrome on `profile_dir`, or on a throwaway profile if that one is in use"""
+    os.makedirs(profile_dir, exist_ok=True)
+    persistent_opts = copy.deepcopy(chrome_options)
+    persistent_opts.add_argument(f'--user-data-dir={profile_dir}')
+    try:
+        driver = webdriver.Chrome(options=persistent_opts)
+        driver.temp_profile = None
+    except WebDriverException:
+        # Most likely "user data directory is already in use" by another
+        # invocation (e.g. a cron watchdog); retry once with a cold profile
+        temp_profile = tempfile.mkdtemp(prefix='openseamap-ais-')
+        chrome_options.add_argument(f'--user-data-dir={temp_profile}')
+        try:
+            driver = webdriver.Chrome(options=chrome_options)
+        except Exception:
+            shutil.rmtree(temp_profile, ignore_errors=True)
+            raise
+        driver.temp_profile = temp_profile
+    return driver
+
+
+def release_driver(driver: "webdriver.Chrome", clear_cache: bool = False):
+    """Return a session to the pool, leaving the browser cache warm unless asked"""
+    try:
+        driver.get('about:blank')
+        if clear_cache:
+            driver.execute_cdp_cmd('Network.clearBrowserCache', {})
+        # Drop buffered log entries so the next run only sees its own events
+        if driver.perf_log:
+            driver.get_log('performance')
+        driver.get_log('browser')
+    except Exception:
+        _quit_driver(driver)
+        return
+    
+    with _POOL_LOCK:
+        _POOL.setdefault(driver.pool_key, []).append(driver)
+
+
+def _quit_driver(driver: "webdriver.Chrome"):
+    """Shut down a browser and remove its profile if it was a throwaway one"""
+    try:
+        driver.quit()
+    except Exception:
+        pass
+    temp_profile = getattr(driver, 'temp_profile', None)
+    if temp_profile:
+        shutil.rmtree(temp_profile, ignore_errors=True)
+    with _POOL_LOCK:
+        _POOL_SLOTS.get(getattr(driver, 'pool_key', None), set()).discard(
+            getattr(driver, 'pool_slot', None))
+
+
+@atexit.register
+def _quit_pooled_drivers():
+    """Shut down every pooled browser on process exit"""
+    for drivers in _POOL.values():
+        for driver in drivers:
+            _quit_driver(driver)
+    _POOL.clear()
+
+
+class SkillCache:
+    """On-disk record of the AIS API calls a site makes, keyed by domain
+    
+    Each entry stores enough to replay the call without a browser:
+    {url_template, method, headers, query_params_schema}.
+    """
+    
+    def __init__(self, path: str = os.path.join(CACHE_DIR, 'skills.json')):
+        self.path = path
+        self.entries = _load_cache_json(path)
+        self.lock = threading.Lock()
+    
+    def get(self, domain: str) -> List[Dict]:
+        """Return the recorded calls for a domain (empty on cache miss)"""
+        # Re-filter headers in case the entry predates REPLAY_HEADERS
+        return [dict(skill, headers=self._replay_headers(skill.get('headers', {})))
+                for skill in self.entries.get(domain, [])]
+    
+    @staticmethod
+    def _replay_headers(headers: Dict) -> Dict:
+        return {k: v for k, v in headers.items() if k.lower() in REPLAY_HEADERS}
+    
+    def record(self, domain: str, network_requests: List[Dict]):
+        """Harvest replayable GET calls from captured requests and persist them"""
+        skills = {}
+        for req in network_requests:
+            if req.get('method') != 'GET':
+                continue
+            parsed = urlparse(req['url'])
+            if parsed.scheme not in ('http', 'https'):
+                continue
+            
+            url_template = f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
+            query_params = dict(parse_qsl(parsed.query, keep_blank_values=True))
+            key = (url_template, tuple(sorted(query_params)))
+            skills[key] = {
+                'url_template': url_template,
+                'method': 'GET',
+                'headers': self._replay_headers(req.get('headers', {})),
+                'query_params_schema': query_params,
+            }
+        
+        if not skills:
+            return
+        
+        with self.lock:
+            self.entries[domain] = list(skills.values())
+            _save_cache_json(self.path, self.entries)
+
 class OpenSeaMapAISMonitor:
     """Monitor OpenSeaMap's AIS layer functionality"""
     
-    def __init__(self, headless: bool = False, verbose: bool = True):
+    _AIS_RE = re.compile('|'.join(map(re.escape, AIS_REQUEST_KEYWORDS)), re.IGNORECASE)
+    _AIS_RESPONSE_RE = re.compile('|'.join(map(re.escape, AIS_RESPONSE_KEYWORDS)), re.IGNORECASE)
+    
+    def __init__(self, headless: bool = False, verbose: bool = True, cold_cache: bool = False,
+                 block_resources: bool = True, tag: str = '',
+                 skill_cache: Optional[SkillCache] = None):
         self.headless = headless
         self.verbose = verbose
+        self.cold_cache = cold_cache
+        self.block_resources = block_resources
+        self.tag = tag  # Distinguishes output files of concurrent runs
         self.driver = None
         self.network_logs = []
+        self.cdp_ws = None
+        self.cdp_events = None  # Network events decoded by the CDP reader thread
+        self.skill_cache = skill_cache or SkillCache()
         
     def setup_driver(self):
         """Initialize Chrome driver with logging capabilities"""
-        chrome_options = Options()
-        
-        if self.headless:
-            chrome_options.add_argument('--headless')
-        
-        # Enable performance logging to capture network requests
-        chrome_options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
+        # Persistent profile so Chrome's disk cache survives between runs;
+        # headed and headless browsers can't share one profile directory
+        profile_dir = os.path.join(CACHE_DIR, 'chrome-profile-headless' if self.headless
+                                   else 'chrome-profile')
         
         try:
-            self.driver = webdriver.Chrome(options=chrome_options)
+            # Network events come over the CDP WebSocket; the performance log
+            # is only turned on when that can't work. Browsers of the two kinds
+            # are pooled separately, so they get separate profiles too.
+            perf_log = websocket is None
+            self.driver = acquire_driver(self._chrome_options(perf_log),
+                                         f"{profile_dir}-perflog" if perf_log else profile_dir)
             if self.verbose:
                 print("✓ Chrome WebDriver initialized successfully")
+            if not self.attach_cdp() and not perf_log:
+                # DevTools endpoint unreachable: swap for a browser that logs
+                # network events
+                release_driver(self.driver)
+                self.driver = acquire_driver(self._chrome_options(True), f"{profile_dir}-perflog")
             return True
         except Exception as e:
             print(f"✗ Failed to initialize Chrome WebDriver: {e}")
@@ -63,12 +417,83 @@ class OpenSeaMapAISMonitor:
             print("     Download from: https://chromedriver.chromium.org/")
             return False
     
-    def load_openseamap(self, url: str = "https://map.openseamap.org") -> bool:
+    def _chrome_options(self, perf_log: bool) -> Options:
+        chrome_options = _perf_log_opts() if perf_log else copy.deepcopy(_BASE_OPTS)
+        if self.headless:
+            chrome_options.add_argument('--headless=new')
+        return chrome_options
+    
+    def attach_cdp(self) -> bool:
+        """Open a direct CDP WebSocket to the current tab for push-based network events
+        
+        Selenium keeps driving the page; only network capture moves off
+        chromedriver's polled performance log. Without websocket-client, or if
+        the DevTools endpoint is unreachable, the performance log is used.
+        """
+        if websocket is None:
+            return False
+        
+        try:
+            address = self.driver.capabilities['goog:chromeOptions']['debuggerAddress']
+            with urlopen(f"http://{address}/json", timeout=5) as response:
+                targets = json.load(response)
+            
+            # chromedriver window handles are CDP target ids
+            target_id = self.driver.current_window_handle.rsplit('-', 1)[-1]
+            pages = [t for t in targets if t.get('type') == 'page']
+            target = next((t for t in pages if t.get('id') == target_id), pages[0])
+            
+            self.cdp_ws = websocket.create_connection(
+                target['webSocketDebuggerUrl'], timeout=5, suppress_origin=True
+            )
+            self.cdp_ws.send(json.dumps({'id': 1, 'method': 'Network.enable', 'params': {}}))
+            
+            # Decode events as they arrive, including during page load, so
+            # capture_network_logs only has to drain the queue
+            self.cdp_events = queue.Queue()
+            threading.Thread(target=self._read_cdp_events,
+                             args=(self.cdp_ws, self.cdp_events), daemon=True).start()
+            
+            if self.verbose:
+                print("✓ Attached to Chrome DevTools WebSocket")
+            return True
+        except Exception as e:
+            if self.verbose:
+                print(f"→ CDP WebSocket unavailable ({e}), using performance log")
+            self.cdp_ws = None
+            self.cdp_events = None
+            return False
+    
+    @staticmethod
+    def _read_cdp_events(ws, events: "queue.Queue"):
+        """Queue (method, params) for each CDP event until the socket is closed"""
+        ws.settimeout(None)
+        while True:
+            try:
+                raw = ws.recv()
+            except Exception:
+                break  # Socket closed
+            
+            if not is_tracked_network_event(raw):
+                continue
+            try:
+                message = json_loads(raw)
+                events.put((message['method'], message['params']))
+            except (ValueError, KeyError):
+                continue
+    
+    def load_openseamap(self, url: str = OPENSEAMAP_URL) -> bool:
         """Load the OpenSeaMap website"""
         try:
             if self.verbose:
                 print(f"\n→ Loading {url}...")
             
+            # Always set the list so a pooled session doesn't keep an old one
+            self.driver.execute_cdp_cmd('Network.enable', {})
+            self.driver.execute_cdp_cmd('Network.setBlockedURLs', {
+                'urls': list(BLOCKED_URL_PATTERNS) if self.block_resources else []
+            })
+            
             self.driver.get(url)
             
             # Wait for map to initialize
@@ -79,7 +504,13 @@ class OpenSeaMapAISMonitor:
             if self.verbose:
                 print("✓ Map container loaded")
             
-            time.sleep(3)  # Give JavaScript time to initialize
+            # Wait for the map's JavaScript to initialize rather than a fixed delay
+            try:
+                WebDriverWait(self.driver, 10).until(
+                    lambda d: d.execute_script(MAP_READY_SCRIPT)
+                )
+            except TimeoutException:
+                time.sleep(0.5)
             return True
             
         except TimeoutException:
@@ -90,30 +521,43 @@ class OpenSeaMapAISMonitor:
             return False
     
     def find_ais_checkbox(self) -> Optional[object]:
-        """Locate the AIS layer checkbox"""
+        """Locate the AIS layer checkbox
+        
+        The selector that won last time for this site is tried first. On a
+        miss, the ID lookup and then every XPath candidate (as one union query,
+        so chromedriver evaluates them in a single round-trip) are probed, and
+        the winner is cached.
+        """
+        domain = urlparse(self.driver.current_url).hostname or ''
+        cache = _load_cache_json(SELECTOR_CACHE_FILE)
+        
+        if domain in cache:
+            selector_type, selector = cache[domain]
+            elements = self.driver.find_elements(SELECTOR_TYPES.get(selector_type, By.ID), selector)
+            if elements:
+                if self.verbose:
+                    print(f"✓ Found AIS checkbox using cached {selector_type}: {selector}")
+                return elements[0]
+        
         possible_selectors = [
             ("ID", "checkLayerAis"),
-            ("CSS", "input[id='checkLayerAis']"),
-            ("XPATH", "//input[@type='checkbox' and contains(@id, 'Ais')]"),
-            ("XPATH", "//label[contains(text(), 'Marine Traffic')]/../input"),
-            ("XPATH", "//label[contains(text(), 'AIS')]/../input"),
+            ("XPATH", " | ".join(AIS_CHECKBOX_XPATHS)),
         ]
         
         for selector_type, selector in possible_selectors:
-            try:
-                if selector_type == "ID":
-                    element = self.driver.find_element(By.ID, selector)
-                elif selector_type == "CSS":
-                    element = self.driver.find_element(By.CSS_SELECTOR, selector)
-                elif selector_type == "XPATH":
-                    element = self.driver.find_element(By.XPATH, selector)
-                
-                if element:
-                    if self.verbose:
-                        print(f"✓ Found AIS checkbox using {selector_type}: {selector}")
-                    return element
-            except NoSuchElementException:
+            elements = self.driver.find_elements(SELECTOR_TYPES[selector_type], selector)
+            if not elements:
                 continue
+            
+            element = elements[0]
+            if self.verbose:
+                print(f"✓ Found AIS checkbox using {selector_type}: {selector}")
+            
+            # Cache the cheapest selector that finds this element again
+            element_id = element.get_attribute('id')
+            cache[domain] = ["ID", element_id] if element_id else [selector_type, selector]
+            _save_cache_json(SELECTOR_CACHE_FILE, cache)
+            return element
         
         return None
     
@@ -155,103 +599,157 @@ class OpenSeaMapAISMonitor:
             print(f"✗ Error enabling AIS layer: {e}")
             return False
     
-    def capture_network_logs(self, duration: int = 10) -> List[Dict]:
-        """Capture network activity for specified duration"""
+    def handle_network_event(self, method: str, params: Dict, by_id: Dict[str, Dict]) -> bool:
+        """Update the captured AIS requests from a single CDP Network event
+        
+        Returns True if the event added or updated an AIS request. Raises
+        KeyError if the event lacks a field the CDP spec makes mandatory.
+        """
+        if method == 'Network.requestWillBeSent':
+            request = params['request']
+            url = request['url']
+            
+            # Filter for AIS-related requests
+            if self._AIS_RE.search(url):
+                request_id = params['requestId']
+                by_id[request_id] = {
+                    # Epoch seconds from Chrome; formatted in analyze_results
+                    'timestamp': params.get('wallTime') or time.time(),
+                    'url': url,
+                    'method': request['method'],
+                    'headers': request.get('headers', {}),
+                    'requestId': request_id
+                }
+                
+                if self.verbose:
+                    print(f"  → Request: {url[:80]}...")
+                return True
+        
+        elif method == 'Network.responseReceived':
+            # Update the matching request with response info
+            req = by_id.get(params['requestId'])
+            response = params['response']
+            
+            if req is not None and self._AIS_RESPONSE_RE.search(response['url']):
+                status = response['status']
+                status_text = response.get('statusText', '')
+                req['status'] = status
+                req['status_text'] = status_text
+                req['content_type'] = response.get('mimeType', '')
+                
+                if self.verbose:
+                    symbol = "✓" if 200 <= status < 300 else "✗"
+                    print(f"  {symbol} Response: {status} {status_text}")
+                return True
+        
+        elif method == 'Network.loadingFailed':
+            if params.get('blockedReason') == 'inspector':
+                # Blocked by our own BLOCKED_URL_PATTERNS (Network.setBlockedURLs),
+                # not a failure of the site's AIS backend; drop it from the
+                # results. Browser blocks (mixed-content, csp, ...) are kept.
+                return by_id.pop(params['requestId'], None) is not None
+            
+            req = by_id.get(params['requestId'])
+            
+            if req is not None:
+                error_text = params['errorText']
+                req['failed'] = True
+                req['error'] = error_text
+                
+                if self.verbose:
+                    print(f"  ✗ Request failed: {error_text}")
+                return True
+        
+        return False
+    
+    def drain_events(self, events: Iterable[Tuple[str, Dict]], by_id: Dict[str, Dict]) -> bool:
+        """Apply a batch of (method, params) events; True if any AIS request changed"""
+        handle = self.handle_network_event
+        changed = False
+        for method, params in events:
+            try:
+                if handle(method, params, by_id):
+                    changed = True
+            except KeyError:
+                continue
+        return changed
+    
+    def capture_network_logs(self, duration: int = 10, expected_requests: int = 1,
+                             settle: float = 1.0) -> List[Dict]:
+        """Capture network activity for up to `duration` seconds
+        
+        Stops early once at least `expected_requests` getAIS calls have been
+        seen, every captured request has a response or failure, and no new AIS
+        event has arrived for `settle` seconds.
+        """
         if self.verbose:
-            print(f"\n→ Monitoring network traffic for {duration} seconds...")
+            print(f"\n→ Monitoring network traffic for up to {duration} seconds...")
         
         start_time = time.time()
-        relevant_requests = []
+        last_activity = start_time
+        by_id: Dict[str, Dict] = {}
         
         while time.time() - start_time < duration:
-            logs = self.driver.get_log('performance')
-            
-            for log in logs:
+            if self.cdp_events is not None:
+                # Events are pushed by Chrome; block until one is queued or it
+                # is time to re-check the early-exit condition, then take
+                # everything else already queued as the same batch
+                remaining = duration - (time.time() - start_time)
+                batch = []
                 try:
-                    log_data = json.loads(log['message'])
-                    message = log_data.get('message', {})
-                    method = message.get('method', '')
-                    
-                    if method == 'Network.requestWillBeSent':
-                        params = message.get('params', {})
-                        request = params.get('request', {})
-                        url = request.get('url', '')
-                        
-                        # Filter for AIS-related requests
-                        if any(keyword in url.lower() for keyword in [
-                            'ais', 'marine', 'traffic', 'ship', 'vessel', 
-                            'getais', 'marinetraffic', 'aishub', 'aisstream'
-                        ]):
-                            relevant_requests.append({
-                                'timestamp': datetime.now().isoformat(),
-                                'url': url,
-                                'method': request.get('method', ''),
-                                'requestId': params.get('requestId', '')
-                            })
-                            
-                            if self.verbose:
-                                print(f"  → Request: {url[:80]}...")
-                    
-                    elif method == 'Network.responseReceived':
-                        params = message.get('params', {})
-                        response = params.get('response', {})
-                        url = response.get('url', '')
-                        
-                        if any(keyword in url.lower() for keyword in [
-                            'ais', 'marine', 'traffic', 'ship', 'vessel'
-                        ]):
-                            status = response.get('status', 0)
-                            status_text = response.get('statusText', '')
-                            
-                            # Update the matching request with response info
-                            request_id = params.get('requestId', '')
-                            for req in relevant_requests:
-                                if req.get('requestId') == request_id:
-                                    req['status'] = status
-                                    req['status_text'] = status_text
-                                    req['content_type'] = response.get('mimeType', '')
-                                    
-                                    if self.verbose:
-                                        symbol = "✓" if 200 <= status < 300 else "✗"
-                                        print(f"  {symbol} Response: {status} {status_text}")
-                    
-                    elif method == 'Network.loadingFailed':
-                        params = message.get('params', {})
-                        request_id = params.get('requestId', '')
-                        error_text = params.get('errorText', '')
-                        
-                        for req in relevant_requests:
-                            if req.get('requestId') == request_id:
-                                req['failed'] = True
-                                req['error'] = error_text
-                                
-                                if self.verbose:
-                                    print(f"  ✗ Request failed: {error_text}")
-                
-                except json.JSONDecodeError:
-                    continue
-                except Exception as e:
-                    if self.verbose:
-                        print(f"  Warning: Error parsing log: {e}")
+                    batch.append(self.cdp_events.get(timeout=max(min(remaining, settle), 0.01)))
+                    while True:
+                        batch.append(self.cdp_events.get_nowait())
+                except queue.Empty:
+                    pass
+            else:
+                # get_log drains every queued event in one call, so a short
+                # poll interval costs little and cuts detection latency
+                batch = parse_performance_log(self.driver.get_log('performance'))
+                time.sleep(0.05)
+            
+            try:
+                if self.drain_events(batch, by_id):
+                    last_activity = time.time()
+            except Exception as e:
+                if self.verbose:
+                    print(f"  Warning: Error handling network event: {e}")
             
-            time.sleep(0.5)
+            if time.time() - last_activity >= settle:
+                ais_calls = sum(1 for req in by_id.values() if 'getais' in req['url'].lower())
+                pending = any('status' not in req and not req.get('failed')
+                              for req in by_id.values())
+                if ais_calls >= expected_requests and not pending:
+                    if self.verbose:
+                        print(f"→ AIS traffic settled after {time.time() - start_time:.1f}s")
+                    break
+        
+        # Dict insertion order keeps requests in the order they were sent
+        relevant_requests = list(by_id.values())
+        
+        # Remember the AIS calls so later runs can skip the browser
+        domain = urlparse(self.driver.current_url).hostname
+        if domain:
+            self.skill_cache.record(domain, relevant_requests)
         
         return relevant_requests
     
     def check_javascript_errors(self) -> List[str]:
-        """Check for JavaScript errors in the browser console"""
+        """Check for JavaScript errors in the browser console
+        
+        chromedriver hands out each log entry only once, so repeated calls
+        only report new errors.
+        """
         try:
             logs = self.driver.get_log('browser')
-            errors = []
             
-            for log in logs:
-                if log['level'] in ['SEVERE', 'ERROR']:
-                    errors.append(f"{log['level']}: {log['message']}")
+            # Filter before formatting so non-error lines cost no string work
+            errors = [f"{log['level']}: {log['message']}" for log in logs
+                      if log['level'] in ('SEVERE', 'ERROR')]
             
             if errors and self.verbose:
                 print(f"\n✗ Found {len(errors)} JavaScript errors:")
-                for error in errors[:5]:  # Show first 5
-                    print(f"  - {error[:150]}...")
+                print("\n".join(f"  - {error[:150]}..." for error in errors[:5]))  # Show first 5
             elif self.verbose:
                 print("\n✓ No JavaScript errors detected")
             
@@ -262,12 +760,30 @@ class OpenSeaMapAISMonitor:
             return []
     
     def take_screenshot(self, filename: str = None):
-        """Save a screenshot of the current state"""
+        """Save a screenshot of the current viewport
+        
+        Captured as WebP straight from CDP (much smaller than Selenium's PNG);
+        falls back to a PNG via Selenium if the CDP call is unavailable.
+        """
         if not filename:
-            filename = f"openseamap_ais_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
+            filename = f"openseamap_ais_{self.file_stamp()}.webp"
         
         try:
-            self.driver.save_screenshot(filename)
+            try:
+                data = self.driver.execute_cdp_cmd('Page.captureScreenshot', {
+                    'format': 'webp',
+                    'quality': 60,
+                    'captureBeyondViewport': False
+                })['data']
+                # Name the file for what it holds, whatever the caller passed
+                webp_filename = os.path.splitext(filename)[0] + '.webp'
+                with open(webp_filename, 'wb') as f:
+                    f.write(base64.b64decode(data))
+                filename = webp_filename
+            except Exception:
+                filename = os.path.splitext(filename)[0] + '.png'
+                self.driver.save_screenshot(filename)
+            
             if self.verbose:
                 print(f"✓ Screenshot saved: {filename}")
             return filename
@@ -275,40 +791,61 @@ class OpenSeaMapAISMonitor:
             print(f"✗ Failed to save screenshot: {e}")
             return None
     
-    def analyze_results(self, network_requests: List[Dict], js_errors: List[str]) -> Dict:
-        """Analyze collected data and generate findings"""
+    def analyze_results(self, network_requests: List[Dict], js_errors: Optional[List[str]]) -> Dict:
+        """Analyze collected data and generate findings
+        
+        js_errors is None when the console was not checked (cached replay).
+        """
         analysis = {
             'timestamp': datetime.now().isoformat(),
             'ais_requests_found': len(network_requests),
             'successful_requests': 0,
             'failed_requests': 0,
             'blocked_requests': 0,
-            'javascript_errors': len(js_errors),
+            'javascript_errors': len(js_errors) if js_errors is not None else None,
             'findings': [],
-            'raw_requests': network_requests,
+            # Request headers are left out: they may carry credentials and
+            # these reports get shared
+            'raw_requests': [
+                {**{k: v for k, v in req.items() if k != 'headers'},
+                 'timestamp': datetime.fromtimestamp(req['timestamp']).isoformat()}
+                for req in network_requests
+            ],
             'raw_errors': js_errors
         }
         
-        # Analyze network requests
+        # Analyze network requests; only the first MAX_FINDINGS are formatted,
+        # the rest are still counted
+        counts = {'successful': 0, 'failed': 0, 'blocked': 0}
+        findings = analysis['findings']
+        omitted = 0
+        
         for req in network_requests:
             if req.get('failed'):
-                analysis['failed_requests'] += 1
-                analysis['findings'].append(
-                    f"FAILED REQUEST: {req['url']} - {req.get('error', 'Unknown error')}"
-                )
+                status_class = 'failed'
             elif 'status' in req:
-                if 200 <= req['status'] < 300:
-                    analysis['successful_requests'] += 1
-                elif req['status'] in [401, 403]:
-                    analysis['blocked_requests'] += 1
-                    analysis['findings'].append(
-                        f"BLOCKED REQUEST: {req['url']} - HTTP {req['status']} {req.get('status_text')}"
-                    )
-                else:
-                    analysis['failed_requests'] += 1
-                    analysis['findings'].append(
-                        f"HTTP ERROR: {req['url']} - {req['status']} {req.get('status_text')}"
-                    )
+                status_class = STATUS_CLASSES[bisect_right(STATUS_BOUNDS, req['status']) - 1]
+            else:
+                continue
+            
+            counts[status_class] += 1
+            if status_class == 'successful':
+                continue
+            if len(findings) >= MAX_FINDINGS:
+                omitted += 1
+            elif req.get('failed'):
+                findings.append(f"FAILED REQUEST: {req['url']} - {req.get('error', 'Unknown error')}")
+            elif status_class == 'blocked':
+                findings.append(
+                    f"BLOCKED REQUEST: {req['url']} - HTTP {req['status']} {req.get('status_text')}"
+                )
+            else:
+                findings.append(f"HTTP ERROR: {req['url']} - {req['status']} {req.get('status_text')}")
+        
+        analysis['successful_requests'] = counts['successful']
+        analysis['failed_requests'] = counts['failed']
+        analysis['blocked_requests'] = counts['blocked']
+        analysis['findings_omitted'] = omitted
         
         # Determine root cause
         if analysis['ais_requests_found'] == 0:
@@ -324,7 +861,125 @@ class OpenSeaMapAISMonitor:
         
         return analysis
     
-    def run_full_diagnostic(self) -> Dict:
+    def replay_skills(self, skills: List[Dict]) -> Optional[List[Dict]]:
+        """Replay cached AIS calls over plain HTTP
+        
+        Returns None when the replay is not trustworthy (HTTP 5xx or an
+        unparseable JSON body), in which case the browser path should be used.
+        """
+        network_requests = []
+        
+        with requests.Session() as session:
+            for skill in skills:
+                url = skill['url_template']
+                req = {
+                    'timestamp': time.time(),
+                    'url': url,
+                    'method': skill['method'],
+                    'requestId': ''
+                }
+                network_requests.append(req)
+                
+                try:
+                    response = session.get(url, params=skill['query_params_schema'],
+                                           headers=skill['headers'], timeout=5)
+                except requests.exceptions.RequestException as e:
+                    req['failed'] = True
+                    req['error'] = str(e)[:200]
+                    if self.verbose:
+                        print(f"  ✗ Request failed: {url[:80]} - {req['error'][:80]}")
+                    continue
+                
+                if response.status_code >= 500:
+                    return None
+                
+                content_type = response.headers.get('Content-Type', '')
+                if 'json' in content_type:
+                    try:
+                        response.json()
+                    except ValueError:
+                        return None
+                
+                req['url'] = response.url
+                req['status'] = response.status_code
+                req['status_text'] = response.reason
+                req['content_type'] = content_type
+                
+                if self.verbose:
+                    symbol = "✓" if 200 <= response.status_code < 300 else "✗"
+                    print(f"  {symbol} Response: {response.status_code} {response.reason}"
+                          f" ({url[:60]})")
+        
+        return network_requests
+    
+    def run_cached_diagnostic(self, url: str = OPENSEAMAP_URL) -> Dict:
+        """Replay the cached AIS calls, falling back to the browser when needed"""
+        skills = self.skill_cache.get(urlparse(url).hostname)
+        if not skills or requests is None:
+            return self.run_full_diagnostic(url)
+        
+        print("\n" + "="*70)
+        print("OpenSeaMap AIS Diagnostic (cached API replay)".center(70))
+        print("="*70 + "\n")
+        
+        if self.verbose:
+            print(f"→ Replaying {len(skills)} cached AIS request(s)...")
+        
+        network_requests = self.replay_skills(skills)
+        if network_requests is None:
+            print("→ Cached replay inconclusive, falling back to browser")
+            return self.run_full_diagnostic(url)
+        
+        analysis = self.analyze_results(network_requests, None)
+        analysis['url'] = url
+        analysis['mode'] = 'cached'
+        self.report(analysis)
+        return analysis
+    
+    def report(self, analysis: Dict):
+        """Print the diagnostic summary and save the detailed JSON report"""
+        js_errors = analysis['javascript_errors']
+        if js_errors is None:
+            js_errors = 'not checked'
+        
+        # Built up and printed in one go so concurrent batch runs don't interleave
+        lines = [
+            "\n" + "="*70,
+            "DIAGNOSTIC SUMMARY".center(70),
+            "="*70,
+        ]
+        if 'url' in analysis:
+            lines.append(f"\nURL: {analysis['url']}")
+        lines += [
+            f"\nAIS Requests Detected: {analysis['ais_requests_found']}",
+            f"Successful Responses:  {analysis['successful_requests']}",
+            f"Failed Requests:       {analysis['failed_requests']}",
+            f"Blocked Requests:      {analysis['blocked_requests']}",
+            f"JavaScript Errors:     {js_errors}",
+            "\nRoot Cause Assessment:",
+            f"  {analysis['root_cause']}",
+        ]
+        
+        if analysis['findings']:
+            lines.append("\nKey Findings:")
+            for finding in analysis['findings'][:MAX_FINDINGS]:
+                lines.append(f"  - {finding}")
+            if analysis.get('findings_omitted'):
+                lines.append(f"  ... and {analysis['findings_omitted']} more")
+        
+        # Save detailed report
+        report_file = f"browser_diagnostic_{self.file_stamp()}.json"
+        with open(report_file, 'wb') as f:
+            f.write(json_dumps_pretty(analysis))
+        lines.append(f"\nDetailed report saved: {report_file}")
+        print("\n".join(lines))
+    
+    def file_stamp(self) -> str:
+        """Timestamp (plus tag, for batch runs) used in output file names"""
+        stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        return f"{stamp}_{self.tag}" if self.tag else stamp
+    
+    def run_full_diagnostic(self, url: str = OPENSEAMAP_URL) -> Dict:
         """Run complete diagnostic test"""
         print("\n" + "="*70)
         print("OpenSeaMap AIS Browser-Based Diagnostic".center(70))
@@ -335,7 +990,7 @@ class OpenSeaMapAISMonitor:
         
         try:
             # Load the map
-            if not self.load_openseamap():
+            if not self.load_openseamap(url):
                 return {'error': 'Failed to load OpenSeaMap'}
             
             # Enable AIS layer
@@ -354,38 +1009,50 @@ class OpenSeaMapAISMonitor:
             
             # Analyze results
             analysis = self.analyze_results(network_requests, js_errors)
+            analysis['url'] = url
             analysis['screenshot'] = screenshot
             
-            # Print summary
-            print("\n" + "="*70)
-            print("DIAGNOSTIC SUMMARY".center(70))
-            print("="*70)
-            print(f"\nAIS Requests Detected: {analysis['ais_requests_found']}")
-            print(f"Successful Responses:  {analysis['successful_requests']}")
-            print(f"Failed Requests:       {analysis['failed_requests']}")
-            print(f"Blocked Requests:      {analysis['blocked_requests']}")
-            print(f"JavaScript Errors:     {analysis['javascript_errors']}")
-            print(f"\nRoot Cause Assessment:")
-            print(f"  {analysis['root_cause']}")
-            
-            if analysis['findings']:
-                print(f"\nKey Findings:")
-                for finding in analysis['findings'][:5]:
-                    print(f"  - {finding}")
-            
-            # Save detailed report
-            report_file = f"browser_diagnostic_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-            with open(report_file, 'w') as f:
-                json.dump(analysis, f, indent=2)
-            print(f"\nDetailed report saved: {report_file}")
+            self.report(analysis)
             
             return analysis
             
         finally:
+            if self.cdp_ws:
+                self.cdp_ws.close()  # Also stops the reader thread
+                self.cdp_ws = None
+                self.cdp_events = None
             if self.driver:
-                self.driver.quit()
+                release_driver(self.driver, clear_cache=self.cold_cache)
+                self.driver = None
                 if self.verbose:
-                    print("\n✓ Browser closed")
+                    print("\n✓ Browser returned to pool")
+    
+    def run_batch(self, urls: List[str], max_workers: int = 4,
+                  use_cache: bool = True) -> List[Dict]:
+        """Diagnose several map URLs concurrently, one pooled browser per worker
+        
+        Each worker drives its own WebDriver session (a session can only be
+        driven by one thread), so network events never mix between URLs.
+        Results are returned in the order of `urls`.
+        """
+        def run_one(index: int, url: str) -> Dict:
+            monitor = OpenSeaMapAISMonitor(
+                headless=self.headless,
+                verbose=self.verbose and max_workers == 1,
+                cold_cache=self.cold_cache,
+                block_resources=self.block_resources,
+                tag=str(index),
+                skill_cache=self.skill_cache
+            )
+            if use_cache:
+                result = monitor.run_cached_diagnostic(url)
+            else:
+                result = monitor.run_full_diagnostic(url)
+            result.setdefault('url', url)
+            return result
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(run_one, range(len(urls)), urls))
 
 def main():
     """Main entry point"""
@@ -398,21 +1065,39 @@ def main():
                        help='Run browser in headless mode')
     parser.add_argument('--quiet', action='store_true',
                        help='Reduce output verbosity')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Always run the browser instead of replaying cached AIS calls')
+    parser.add_argument('--full-load', action='store_true',
+                       help='Load every page resource (no blocking), e.g. for screenshots')
+    parser.add_argument('--url', dest='urls', action='append',
+                       help=f'Map URL to test (repeatable; default {OPENSEAMAP_URL})')
+    parser.add_argument('--workers', type=int, default=4,
+                       help='Concurrent browsers when several --url are given')
     
     args = parser.parse_args()
     
     monitor = OpenSeaMapAISMonitor(
         headless=args.headless,
-        verbose=not args.quiet
+        verbose=not args.quiet,
+        block_resources=not args.full_load
     )
     
+    urls = args.urls or [OPENSEAMAP_URL]
+    
     try:
-        results = monitor.run_full_diagnostic()
+        if len(urls) > 1:
+            all_results = monitor.run_batch(urls, max_workers=args.workers,
+                                            use_cache=not args.no_cache)
+        elif args.no_cache:
+            all_results = [monitor.run_full_diagnostic(urls[0])]
+        else:
+            all_results = [monitor.run_cached_diagnostic(urls[0])]
         
         # Exit with appropriate code
-        if 'error' in results:
+        if any('error' in results for results in all_results):
             sys.exit(1)
-        elif results.get('failed_requests', 0) > 0 or results.get('blocked_requests', 0) > 0:
+        elif any(results.get('failed_requests', 0) > 0 or results.get('blocked_requests', 0) > 0
+                 for results in all_results):
             sys.exit(2)  # Tests ran but issues detected
         else:
             sys.exit(0)  # Success
@@ -12,12 +12,185 @@ Based on investigation of:
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import MaxRetryError, NewConnectionError, TimeoutError as Urllib3TimeoutError
+from urllib3.util.retry import Retry
+import os
 import sys
 import json
+import math
+import re
+import socket
+import traceback
+import functools
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, List, NamedTuple, Set, Tuple, Optional
+from urllib.parse import urlparse
 import time
 
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # Tile grids fall back to per-point math
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Falls back to the stdlib json module
+
+# Per-phase timings for the report: DNS lookups by host, then one entry per
+# HTTP request sent. Connect and TLS time are not split out; they fall into
+# the ttfb_ms of the first request on each pooled connection.
+TIMINGS: Dict[str, object] = {'dns_ms': {}, 'requests': []}
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000, 1)
+
+_system_getaddrinfo = socket.getaddrinfo
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_lookup(host, port, family, type, proto, flags):
+    # Only runs on a cache miss, so this times the real lookup
+    start = time.monotonic()
+    result = _system_getaddrinfo(host, port, family, type, proto, flags)
+    TIMINGS['dns_ms'][host] = _ms(time.monotonic() - start)
+    return result
+
+
+def _cached_getaddrinfo(host, port, family=0, type=0, proto=0, flags=0):
+    """socket.getaddrinfo memoized per process; failures are not cached"""
+    return list(_cached_lookup(host, port, family, type, proto, flags))
+
+
+# Each host is resolved once per run: by the DNS check, then reused by every
+# HTTP connection to it
+socket.getaddrinfo = _cached_getaddrinfo
+
+CACHE_DIR = os.path.expanduser('~/.cache/openseamap-diag')
+
+_DIAG_HEADERS = {'User-Agent': 'OpenSeaMap-Diagnostic/1.0'}
+_BROWSER_HEADERS = {'User-Agent': 'Mozilla/5.0'}
+_GITHUB_HEADERS = {'Accept': 'application/vnd.github+json'}
+_AIS_PATTERN = re.compile(r'ais|marine|traffic', re.IGNORECASE)
+_MT_TILE_URL_TEMPLATE = ("https://tiles.marinetraffic.com/ais_helpers/shiptilesingle.aspx"
+                         "?output=png&sat=1&grouping=shiptype&tile_size=512&legends=1"
+                         "&zoom={zoom}&X={x}&Y={y}")
+
+# One shared connection pool so probes to the same host reuse TCP/TLS
+# connections. Streamed probes always go through STREAM_SESSION: they read at
+# most BODY_CAP bytes, and requests-cache would read and store whole bodies.
+# SESSION serves everything else and becomes a revalidating cache in main()
+# when requests-cache is installed (see enable_response_cache).
+STREAM_SESSION = requests.Session()
+STREAM_SESSION.headers.update(_DIAG_HEADERS)
+SESSION = STREAM_SESSION
+
+class TimingAdapter(HTTPAdapter):
+    """
+    HTTPAdapter that records, per request, the time until the response
+    headers arrive and the time spent reading the body. Retries and their
+    backoff run inside send(), so ttfb_ms covers every attempt; 'attempts'
+    says how many there were. Failed requests are recorded too, with 'error'.
+    """
+    
+    def send(self, request, **kwargs):
+        entry = {
+            'method': request.method,
+            'url': request.url,
+            'status': None,
+            'attempts': 1,
+            'ttfb_ms': None,
+            'body_ms': None,
+            'total_ms': None,
+            'error': None,
+        }
+        TIMINGS['requests'].append(entry)
+        start = time.monotonic()
+        try:
+            response = super().send(request, **kwargs)
+            headers_at = time.monotonic()
+            entry['status'] = response.status_code
+            entry['ttfb_ms'] = _ms(headers_at - start)
+            retries = getattr(response.raw, 'retries', None)
+            if retries is not None:
+                entry['attempts'] = len(retries.history) + 1
+            if not kwargs.get('stream'):
+                # Session.send would read the body next anyway; do it here to time it
+                response.content
+                entry['body_ms'] = _ms(time.monotonic() - headers_at)
+            return response
+        except Exception as e:
+            cause = e.args[0] if e.args else None
+            if isinstance(cause, MaxRetryError):
+                entry['attempts'] = RETRIES + 1
+            entry['error'] = error_message(e)
+            raise
+        finally:
+            entry['total_ms'] = _ms(time.monotonic() - start)
+
+# Transient gateway errors and dropped connections are retried on the pooled
+# connection with a short backoff, rather than failing the whole probe; once
+# retries run out the last response is returned as-is
+REQUEST_TIMEOUT = 5  # Seconds, applied separately to connect and to each read
+RETRIES = 2
+RETRY_BACKOFF = 0.3
+# Worst case: every attempt uses up both the connect and the read timeout.
+# urllib3 sleeps backoff * 2**(n-1) before the n-th consecutive retry, but
+# not at all before the first; Retry-After is ignored so nothing else waits.
+TIMEOUT_BUDGET = 2 * REQUEST_TIMEOUT * (RETRIES + 1) + sum(
+    RETRY_BACKOFF * 2 ** (n - 1) for n in range(2, RETRIES + 1))
+_retry = Retry(
+    total=RETRIES,
+    backoff_factor=RETRY_BACKOFF,
+    status_forcelist=(502, 503, 504),
+    allowed_methods=frozenset(['GET', 'HEAD']),
+    raise_on_status=False,
+    # A 503 with Retry-After: 3600 must not stall the probe for an hour
+    respect_retry_after_header=False,
+)
+_adapter = TimingAdapter(pool_connections=10, pool_maxsize=10, max_retries=_retry)
+STREAM_SESSION.mount('https://', _adapter)
+STREAM_SESSION.mount('http://', _adapter)
+
+def enable_response_cache():
+    """
+    Switch SESSION to an on-disk cache if requests-cache is installed.
+    Responses carrying an ETag/Last-Modified are revalidated on every run, so
+    unchanged pages come back as a bodiless 304 instead of a full download.
+    """
+    global SESSION
+    if requests_cache is None or SESSION is not STREAM_SESSION:
+        return
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    session = requests_cache.CachedSession(
+        os.path.join(CACHE_DIR, 'diag'),
+        backend='sqlite',
+        expire_after=requests_cache.EXPIRE_IMMEDIATELY,
+        always_revalidate=True,
+    )
+    session.headers.update(_DIAG_HEADERS)
+    session.mount('https://', _adapter)
+    session.mount('http://', _adapter)
+    SESSION = session
+
+class ProbeResult(NamedTuple):
+    """Outcome of one probe; unpacks like the (success, message) tuples it wraps"""
+    success: bool
+    message: str
+
+def json_dumps_pretty(data) -> bytes:
+    """Serialize a report as indented UTF-8 JSON"""
+    if orjson:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode('utf-8')
+
 class Colors:
     """ANSI color codes for terminal output"""
     GREEN = '\033[92m'
@@ -27,16 +200,84 @@ class Colors:
     RESET = '\033[0m'
     BOLD = '\033[1m'
 
+# Colored prefixes and the section rule are built once at import
+_STATUS_PREFIX = {
+    'OK': f"{Colors.GREEN}    OK{Colors.RESET} | ",
+    'FAIL': f"{Colors.RED}  FAIL{Colors.RESET} | ",
+    'INFO': f"{Colors.YELLOW}  INFO{Colors.RESET} | ",
+}
+_SECTION_RULE = f"{Colors.BOLD}{Colors.BLUE}{'='*70}{Colors.RESET}"
+
 def print_status(status: str, message: str):
     """Print formatted status message"""
-    color = Colors.GREEN if status == "OK" else Colors.RED if status == "FAIL" else Colors.YELLOW
-    print(f"{color}{status:>6}{Colors.RESET} | {message}")
+    prefix = _STATUS_PREFIX.get(status) or f"{Colors.YELLOW}{status:>6}{Colors.RESET} | "
+    sys.stdout.write(f"{prefix}{message}\n")
 
 def print_section(title: str):
     """Print section header"""
-    print(f"\n{Colors.BOLD}{Colors.BLUE}{'='*70}{Colors.RESET}")
-    print(f"{Colors.BOLD}{Colors.BLUE}{title.center(70)}{Colors.RESET}")
-    print(f"{Colors.BOLD}{Colors.BLUE}{'='*70}{Colors.RESET}\n")
+    sys.stdout.write(f"\n{_SECTION_RULE}\n"
+                     f"{Colors.BOLD}{Colors.BLUE}{title.center(70)}{Colors.RESET}\n"
+                     f"{_SECTION_RULE}\n\n")
+
+BODY_CAP = 4096  # Most bytes of a response body any probe reads
+
+def read_capped(response: requests.Response, limit: int = BODY_CAP) -> Tuple[bytes, bool]:
+    """Read at most `limit` bytes of a streamed response body; returns (data, truncated)"""
+    data = response.raw.read(limit + 1, decode_content=True)
+    return data[:limit], len(data) > limit
+
+def is_timeout(e: Exception) -> bool:
+    """
+    True if a request failed by timing out. Once retries run out, urllib3
+    raises MaxRetryError and requests re-raises a read timeout as a plain
+    ConnectionError, so the underlying reason has to be unwrapped.
+    """
+    if isinstance(e, requests.exceptions.Timeout):
+        return True
+    cause = e.args[0] if e.args else None
+    reason = getattr(cause, 'reason', cause)
+    # NewConnectionError (e.g. connection refused) subclasses ConnectTimeoutError
+    return isinstance(reason, Urllib3TimeoutError) and not isinstance(reason, NewConnectionError)
+
+def timeout_message() -> str:
+    return (f"Request timeout ({RETRIES + 1} attempts x {REQUEST_TIMEOUT}s connect/read, "
+            f"up to {TIMEOUT_BUDGET:.1f}s)")
+
+def error_message(e: Exception) -> str:
+    """Short failure text for a probe that raised"""
+    if is_timeout(e):
+        return timeout_message()
+    # Report what urllib3 gave up on (name resolution, refused connection,
+    # SSL, ...) rather than the generic "Max retries exceeded" wrapper
+    cause = e.args[0] if e.args else None
+    reason = getattr(cause, 'reason', None)
+    if reason is None:
+        return f"Error: {str(e)[:100]}"
+    message = str(reason)
+    if isinstance(reason, NewConnectionError):
+        # Drop the leading "HTTPSConnection(host=..., port=...): "
+        message = message.split(': ', 1)[-1]
+    return f"Error: {message[:100]}"
+
+# Hosts that failed the DNS check this run; probes against them are skipped
+# instead of waiting out a connection attempt that cannot succeed
+_DEAD_HOSTS: Set[str] = set()
+DNS_SKIPPED = (False, "Skipped: DNS resolution failed")
+
+def host_is_dead(url: str) -> bool:
+    """True if the DNS check already failed for this URL's host"""
+    return urlparse(url).hostname in _DEAD_HOSTS
+
+def probe_status(url: str, **kwargs) -> requests.Response:
+    """
+    Fetch only the status of a URL: HEAD (following redirects like GET does),
+    or, for servers that reject HEAD, a streamed GET closed before the body is read.
+    """
+    response = SESSION.head(url, allow_redirects=True, **kwargs)
+    if response.status_code in (405, 501):
+        response = STREAM_SESSION.get(url, stream=True, **kwargs)
+        response.close()
+    return response
 
 def test_marinetraffic_tiles(lat: float = 51.5, lon: float = -0.1, zoom: int = 10) -> Tuple[bool, str]:
     """
@@ -46,55 +287,113 @@ def test_marinetraffic_tiles(lat: float = 51.5, lon: float = -0.1, zoom: int = 1
     https://tiles.marinetraffic.com/ais_helpers/shiptilesingle.aspx
     """
     # Calculate tile coordinates from lat/lon/zoom
-    import math
     n = 2.0 ** zoom
     x = int((lon + 180.0) / 360.0 * n)
     y = int((1.0 - math.asinh(math.tan(math.radians(lat))) / math.pi) / 2.0 * n)
     
-    url = (f"https://tiles.marinetraffic.com/ais_helpers/shiptilesingle.aspx"
-           f"?output=png&sat=1&grouping=shiptype&tile_size=512&legends=1"
-           f"&zoom={zoom}&X={x}&Y={y}")
+    return probe_marinetraffic_tile(zoom, x, y)
+
+def _check_coordinate_lengths(n_lats: int, n_lons: int):
+    """
+    lats and lons must be the same length, except that a single value is
+    repeated to match a non-empty other side
+    """
+    if n_lats != n_lons and (0 in (n_lats, n_lons) or 1 not in (n_lats, n_lons)):
+        raise ValueError(f"lats and lons differ in length ({n_lats} vs {n_lons})")
+
+def _coordinate_list(values) -> List[float]:
+    try:
+        return [float(v) for v in values]
+    except TypeError:  # A scalar
+        return [float(values)]
+
+def test_marinetraffic_tile_grid(lats, lons, zoom: int = 10) -> Dict[Tuple[int, int], Tuple[bool, str]]:
+    """
+    Probe the MarineTraffic tile covering each (lat, lon) pair, e.g. to check
+    coverage across regions. Tile coordinates are computed in one vectorized
+    pass when NumPy is available; each distinct tile is fetched once and all
+    fetches run concurrently. Results are keyed by (x, y).
+    
+    Either argument may be a scalar; otherwise lengths must match. Raises
+    ValueError for mismatched lengths or non-finite coordinates.
+    """
+    n = 2.0 ** zoom
+    if np is not None:
+        lats = np.atleast_1d(np.asarray(lats, dtype=np.float64))
+        lons = np.atleast_1d(np.asarray(lons, dtype=np.float64))
+        if lats.ndim > 1 or lons.ndim > 1:
+            raise ValueError("lats and lons must be one-dimensional")
+        _check_coordinate_lengths(lats.size, lons.size)
+        lats, lons = np.broadcast_arrays(lats, lons)
+        if not (np.isfinite(lats).all() and np.isfinite(lons).all()):
+            raise ValueError("coordinates must be finite")
+        xs = ((lons + 180.0) / 360.0 * n).astype(np.int32).tolist()
+        ys = ((1.0 - np.arcsinh(np.tan(np.radians(lats))) / np.pi) / 2.0 * n).astype(np.int32).tolist()
+    else:
+        lats, lons = _coordinate_list(lats), _coordinate_list(lons)
+        _check_coordinate_lengths(len(lats), len(lons))
+        if len(lats) == 1:
+            lats = lats * len(lons)
+        elif len(lons) == 1:
+            lons = lons * len(lats)
+        if not all(map(math.isfinite, lats + lons)):
+            raise ValueError("coordinates must be finite")
+        xs = [int((lon + 180.0) / 360.0 * n) for lon in lons]
+        ys = [int((1.0 - math.asinh(math.tan(math.radians(lat))) / math.pi) / 2.0 * n) for lat in lats]
+    
+    tiles = list(dict.fromkeys(zip(xs, ys)))
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = {tile: executor.submit(probe_marinetraffic_tile, zoom, *tile) for tile in tiles}
+    return {tile: future.result() for tile, future in futures.items()}
+
+def probe_marinetraffic_tile(zoom: int, x: int, y: int) -> Tuple[bool, str]:
+    """Fetch the headers of a single MarineTraffic tile and classify the response"""
+    url = _MT_TILE_URL_TEMPLATE.format(zoom=zoom, x=x, y=y)
+    if host_is_dead(url):
+        return DNS_SKIPPED
     
     try:
-        response = requests.get(url, timeout=10, headers={
-            'User-Agent': 'OpenSeaMap-Diagnostic/1.0'
-        })
-        
-        if response.status_code == 200:
-            content_type = response.headers.get('Content-Type', '')
-            if 'image' in content_type:
-                return True, f"Tile service responding (HTTP {response.status_code}, {len(response.content)} bytes)"
+        # Only the headers matter; the tile image itself is never downloaded
+        with STREAM_SESSION.get(url, timeout=REQUEST_TIMEOUT, stream=True) as response:
+            if response.status_code == 200:
+                content_type = response.headers.get('Content-Type', '')
+                size = response.headers.get('Content-Length', 'unknown')
+                if 'image' in content_type:
+                    return True, f"Tile service responding (HTTP {response.status_code}, {size} bytes)"
+                else:
+                    return False, f"Unexpected content type: {content_type}"
+            elif response.status_code == 403:
+                return False, "Access denied (HTTP 403) - API likely commercialized"
+            elif response.status_code == 401:
+                return False, "Authentication required (HTTP 401) - API key needed"
             else:
-                return False, f"Unexpected content type: {content_type}"
-        elif response.status_code == 403:
-            return False, "Access denied (HTTP 403) - API likely commercialized"
-        elif response.status_code == 401:
-            return False, "Authentication required (HTTP 401) - API key needed"
-        else:
-            return False, f"HTTP {response.status_code}: {response.text[:200]}"
-    except requests.exceptions.Timeout:
-        return False, "Request timeout (10s)"
+                body, _ = read_capped(response, 200)
+                return False, f"HTTP {response.status_code}: {body.decode('utf-8', 'replace')}"
     except requests.exceptions.ConnectionError as e:
+        if is_timeout(e):
+            return False, timeout_message()
         return False, f"Connection error: {str(e)[:100]}"
+    except requests.exceptions.Timeout:
+        return False, timeout_message()
     except Exception as e:
-        return False, f"Error: {str(e)[:100]}"
+        return False, error_message(e)
 
 def test_marinetraffic_api_simple() -> Tuple[bool, str]:
     """Test if MarineTraffic API is accessible without authentication"""
     # Try a simple public endpoint
     url = "https://www.marinetraffic.com/en/data/?asset_type=vessels"
+    if host_is_dead(url):
+        return DNS_SKIPPED
     
     try:
-        response = requests.get(url, timeout=10, headers={
-            'User-Agent': 'Mozilla/5.0'
-        })
+        response = probe_status(url, timeout=REQUEST_TIMEOUT, headers=_BROWSER_HEADERS)
         
         if response.status_code == 200:
             return True, f"MarineTraffic website accessible (HTTP {response.status_code})"
         else:
             return False, f"HTTP {response.status_code}"
     except Exception as e:
-        return False, f"Error: {str(e)[:100]}"
+        return False, error_message(e)
 
 def test_aishub_api(mmsi: Optional[int] = None) -> Tuple[bool, str]:
     """
@@ -103,6 +402,8 @@ def test_aishub_api(mmsi: Optional[int] = None) -> Tuple[bool, str]:
     """
     # Try to get vessels in a bounding box (requires registration but can test endpoint)
     url = "https://data.aishub.net/ws.php"
+    if host_is_dead(url):
+        return DNS_SKIPPED
     params = {
         'username': 'DEMO',  # Demo account for testing
         'format': '1',  # JSON
@@ -111,74 +412,84 @@ def test_aishub_api(mmsi: Optional[int] = None) -> Tuple[bool, str]:
     }
     
     try:
-        response = requests.get(url, params=params, timeout=10)
-        
-        if response.status_code == 200:
-            try:
-                data = response.json()
-                if isinstance(data, list) and len(data) > 0:
-                    return True, f"AISHub API responding with data ({len(data)} entries)"
-                elif 'ERROR' in str(data):
-                    return False, f"API error: {data}"
-                else:
-                    return True, "AISHub endpoint accessible (authentication likely required)"
-            except json.JSONDecodeError:
-                return False, f"Invalid JSON response: {response.text[:200]}"
-        elif response.status_code == 401:
-            return False, "Authentication required - valid credentials needed"
-        else:
-            return False, f"HTTP {response.status_code}"
+        with STREAM_SESSION.get(url, params=params, timeout=REQUEST_TIMEOUT, stream=True) as response:
+            if response.status_code == 200:
+                body, truncated = read_capped(response)
+                if truncated:
+                    # Too large to parse whole; a JSON array means vessel data
+                    if body.lstrip().startswith(b'['):
+                        return True, f"AISHub API responding with data (>{BODY_CAP} bytes)"
+                    return False, f"Unexpected response: {body[:200].decode('utf-8', 'replace')}"
+                try:
+                    data = json.loads(body)
+                    if isinstance(data, list) and len(data) > 0:
+                        return True, f"AISHub API responding with data ({len(data)} entries)"
+                    elif 'ERROR' in str(data):
+                        return False, f"API error: {data}"
+                    else:
+                        return True, "AISHub endpoint accessible (authentication likely required)"
+                except ValueError:
+                    return False, f"Invalid JSON response: {body[:200].decode('utf-8', 'replace')}"
+            elif response.status_code == 401:
+                return False, "Authentication required - valid credentials needed"
+            else:
+                return False, f"HTTP {response.status_code}"
     except Exception as e:
-        return False, f"Error: {str(e)[:100]}"
+        return False, error_message(e)
 
 def test_aisstream_websocket() -> Tuple[bool, str]:
     """
     Test AISstream.io (modern AIS data provider with WebSocket API)
     """
     # url = "https://stream.aisstream.io/v0/stream"   # note url not used
+    url = "https://aisstream.io"
+    if host_is_dead(url):
+        return DNS_SKIPPED
     
     try:
         # Just test if the endpoint exists (full WebSocket test would be more complex)
-        response = requests.get("https://aisstream.io", timeout=10)
+        response = probe_status(url, timeout=REQUEST_TIMEOUT)
         if response.status_code == 200:
             return True, "AISstream.io website accessible (WebSocket API available)"
         else:
             return False, f"HTTP {response.status_code}"
     except Exception as e:
-        return False, f"Error: {str(e)[:100]}"
+        return False, error_message(e)
 
 def test_openseamap_api_endpoints() -> Dict[str, Tuple[bool, str]]:
     """Test OpenSeaMap's own API endpoints"""
     base_url = "https://map.openseamap.org"
+    if host_is_dead(base_url):
+        return {name: DNS_SKIPPED for name in ('main_page', 'api_directory', 'getAIS_endpoint')}
     
     results = {}
     
     # Test main map page
     try:
-        response = requests.get(base_url, timeout=10)
+        response = probe_status(base_url, timeout=REQUEST_TIMEOUT)
         results['main_page'] = (
             response.status_code == 200,
             f"HTTP {response.status_code}"
         )
     except Exception as e:
-        results['main_page'] = (False, f"Error: {str(e)[:100]}")
+        results['main_page'] = (False, error_message(e))
     
     # Test API directory
     api_url = f"{base_url}/api/"
     try:
-        response = requests.get(api_url, timeout=10)
+        response = probe_status(api_url, timeout=REQUEST_TIMEOUT)
         results['api_directory'] = (
             response.status_code in [200, 403],  # 403 might mean it exists but is restricted
             f"HTTP {response.status_code}"
         )
     except Exception as e:
-        results['api_directory'] = (False, f"Error: {str(e)[:100]}")
+        results['api_directory'] = (False, error_message(e))
     
     # Test getAIS.php endpoint (from the GitHub code)
     # This endpoint expects bbox parameters but we can test if it exists
     ais_url = f"{base_url}/api/getAIS.php"
     try:
-        response = requests.get(ais_url, timeout=10, params={
+        response = SESSION.get(ais_url, timeout=REQUEST_TIMEOUT, params={
             'bbox': '0,0,1,1'
         })
         results['getAIS_endpoint'] = (
@@ -186,58 +497,62 @@ def test_openseamap_api_endpoints() -> Dict[str, Tuple[bool, str]]:
             f"HTTP {response.status_code}"
         )
     except Exception as e:
-        results['getAIS_endpoint'] = (False, f"Error: {str(e)[:100]}")
+        results['getAIS_endpoint'] = (False, error_message(e))
     
     return results
 
 def check_dns_resolution(domains: List[str]) -> Dict[str, Tuple[bool, str]]:
-    """Check if critical domains resolve properly"""
-    import socket
-    results = {}
+    """Check if critical domains resolve properly (all lookups run concurrently)"""
     
-    for domain in domains:
+    def resolve(domain: str) -> Tuple[bool, str]:
         try:
-            ip = socket.gethostbyname(domain)
-            results[domain] = (True, f"Resolves to {ip}")
+            # Same call shape as urllib3's, so the HTTP probes hit the DNS cache
+            addresses = socket.getaddrinfo(domain, 443, socket.AF_UNSPEC, socket.SOCK_STREAM)
+            ip = next((a[4][0] for a in addresses if a[0] == socket.AF_INET), addresses[0][4][0])
+            return True, f"Resolves to {ip}"
         except socket.gaierror:
-            results[domain] = (False, "DNS resolution failed")
+            return False, "DNS resolution failed"
         except Exception as e:
-            results[domain] = (False, f"Error: {str(e)[:100]}")
+            return False, f"Error: {str(e)[:100]}"
     
-    return results
+    with ThreadPoolExecutor(max_workers=len(domains) or 1) as executor:
+        futures = {executor.submit(resolve, domain): domain for domain in domains}
+        resolved = {futures[future]: future.result() for future in as_completed(futures)}
+    
+    # Keep the caller's domain order for printing
+    return {domain: resolved[domain] for domain in domains}
 
 def analyze_github_issues() -> Tuple[bool, str]:
     """
     Check the GitHub repository for recent issues about AIS
     """
-    url = "https://api.github.com/repos/OpenSeaMap/online_chart/issues"
+    url = "https://api.github.com/search/issues"
     
     try:
-        response = requests.get(url, timeout=10, params={
-            'state': 'all',
-            'per_page': 30
-        })
+        # Let GitHub do the filtering and send back only the few best matches
+        response = SESSION.get(url, timeout=REQUEST_TIMEOUT, params={
+            'q': 'repo:OpenSeaMap/online_chart ais OR marine OR traffic',
+            'sort': 'updated',
+            'per_page': 5
+        }, headers=_GITHUB_HEADERS)
         
         if response.status_code == 200:
-            issues = response.json()
-            ais_issues = [
-                issue for issue in issues 
-                if 'ais' in issue.get('title', '').lower() or 
-                   'marine' in issue.get('title', '').lower() or
-                   'traffic' in issue.get('title', '').lower()
-            ]
+            data = response.json()
+            ais_issues = data.get('items', [])
+            # Search also matches issue bodies; prefer issues about AIS by title
+            titled = [i for i in ais_issues if _AIS_PATTERN.search(i.get('title') or '')]
             
             if ais_issues:
-                recent = ais_issues[0]
-                return True, (f"Found {len(ais_issues)} AIS-related issues. "
+                recent = (titled or ais_issues)[0]
+                return True, (f"Found {data.get('total_count', len(ais_issues))} AIS-related issues. "
                             f"Most recent: '{recent['title']}' "
                             f"(#{recent['number']}, {recent['state']})")
             else:
-                return True, f"No AIS-specific issues found in recent {len(issues)} issues"
+                return True, "No AIS-specific issues found"
         else:
             return False, f"HTTP {response.status_code}"
     except Exception as e:
-        return False, f"Error: {str(e)[:100]}"
+        return False, error_message(e)
 
 def generate_recommendations(test_results: Dict) -> List[str]:
     """Generate recommendations based on test results"""
@@ -280,10 +595,16 @@ def main():
     print(f"Run at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print(f"Python: {sys.version.split()[0]}\n")
     
+    enable_response_cache()
+    # Timings cover this run only
+    TIMINGS['dns_ms'].clear()
+    TIMINGS['requests'].clear()
+    # Each run asks the resolver afresh, so the DNS check can see an outage
+    # that began after an earlier run in this process
+    _cached_lookup.cache_clear()
+    
     test_results = {}
     
-    # Test 1: DNS Resolution
-    print_section("DNS Resolution Check")
     critical_domains = [
         'map.openseamap.org',
         'tiles.marinetraffic.com',
@@ -291,44 +612,59 @@ def main():
         'aisstream.io'
     ]
     
+    # Test 1: DNS Resolution. It runs first so the probes below can skip any
+    # host that does not resolve.
+    print_section("DNS Resolution Check")
     dns_results = check_dns_resolution(critical_domains)
     for domain, (success, message) in dns_results.items():
         print_status("OK" if success else "FAIL", f"{domain}: {message}")
-    
-    # Test 2: MarineTraffic (Historical Data Source)
-    print_section("MarineTraffic Service (Historical Provider)")
-    success, message = test_marinetraffic_tiles(51.5074, -0.1278, 10)  # London
-    test_results['marinetraffic_tiles'] = (success, message)
-    print_status("OK" if success else "FAIL", f"Tile service: {message}")
-    
-    success, message = test_marinetraffic_api_simple()
-    test_results['marinetraffic_web'] = (success, message)
-    print_status("OK" if success else "FAIL", f"Website: {message}")
-    
-    # Test 3: Alternative AIS Sources
-    print_section("Alternative AIS Data Sources")
-    
-    success, message = test_aishub_api()
-    test_results['aishub_api'] = (success, message)
-    print_status("OK" if success else "FAIL", f"AISHub.net: {message}")
-    
-    success, message = test_aisstream_websocket()
-    test_results['aisstream'] = (success, message)
-    print_status("OK" if success else "FAIL", f"AISstream.io: {message}")
-    
-    # Test 4: OpenSeaMap Infrastructure
-    print_section("OpenSeaMap Infrastructure")
-    osm_results = test_openseamap_api_endpoints()
-    test_results['openseamap_endpoints'] = osm_results
-    
-    for endpoint, (success, message) in osm_results.items():
-        print_status("OK" if success else "FAIL", f"{endpoint}: {message}")
-    
-    # Test 5: GitHub Issues
-    print_section("GitHub Repository Analysis")
-    success, message = analyze_github_issues()
-    test_results['github_issues'] = (success, message)
-    print_status("INFO", message)
+    # Rebuilt every run, so a host that resolves again is probed again
+    _DEAD_HOSTS.clear()
+    _DEAD_HOSTS.update(domain for domain, (ok, _) in dns_results.items() if not ok)
+    
+    # The probes are independent and network-bound, so run them all at once;
+    # results are still printed section by section as they become available
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = {
+            'marinetraffic_tiles': executor.submit(test_marinetraffic_tiles, 51.5074, -0.1278, 10),  # London
+            'marinetraffic_web': executor.submit(test_marinetraffic_api_simple),
+            'aishub_api': executor.submit(test_aishub_api),
+            'aisstream': executor.submit(test_aisstream_websocket),
+            'openseamap_endpoints': executor.submit(test_openseamap_api_endpoints),
+            'github_issues': executor.submit(analyze_github_issues),
+        }
+        
+        # Test 2: MarineTraffic (Historical Data Source)
+        print_section("MarineTraffic Service (Historical Provider)")
+        success, message = test_results['marinetraffic_tiles'] = ProbeResult(*futures['marinetraffic_tiles'].result())
+        print_status("OK" if success else "FAIL", f"Tile service: {message}")
+        
+        success, message = test_results['marinetraffic_web'] = ProbeResult(*futures['marinetraffic_web'].result())
+        print_status("OK" if success else "FAIL", f"Website: {message}")
+        
+        # Test 3: Alternative AIS Sources
+        print_section("Alternative AIS Data Sources")
+        
+        success, message = test_results['aishub_api'] = ProbeResult(*futures['aishub_api'].result())
+        print_status("OK" if success else "FAIL", f"AISHub.net: {message}")
+        
+        success, message = test_results['aisstream'] = ProbeResult(*futures['aisstream'].result())
+        print_status("OK" if success else "FAIL", f"AISstream.io: {message}")
+        
+        # Test 4: OpenSeaMap Infrastructure
+        print_section("OpenSeaMap Infrastructure")
+        osm_results = test_results['openseamap_endpoints'] = {
+            endpoint: ProbeResult(*result)
+            for endpoint, result in futures['openseamap_endpoints'].result().items()
+        }
+        
+        for endpoint, (success, message) in osm_results.items():
+            print_status("OK" if success else "FAIL", f"{endpoint}: {message}")
+        
+        # Test 5: GitHub Issues
+        print_section("GitHub Repository Analysis")
+        success, message = test_results['github_issues'] = ProbeResult(*futures['github_issues'].result())
+        print_status("INFO", message)
     
     # Generate Report
     print_section("Diagnostic Summary & Recommendations")
@@ -372,20 +708,21 @@ def main():
     
     # Save detailed report
     report_file = f"ais_diagnostic_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-    with open(report_file, 'w') as f:
-        json.dump({
+    with open(report_file, 'wb') as f:
+        f.write(json_dumps_pretty({
             'timestamp': datetime.now().isoformat(),
             'test_results': {
-                k: {'success': v[0], 'message': v[1]} 
-                for k, v in test_results.items() 
+                k: v._asdict()
+                for k, v in test_results.items()
                 if not isinstance(v, dict)
             },
             'openseamap_endpoints': {
-                k: {'success': v[0], 'message': v[1]}
+                k: v._asdict()
                 for k, v in test_results['openseamap_endpoints'].items()
             },
-            'recommendations': recommendations
-        }, f, indent=2)
+            'recommendations': recommendations,
+            'timings': TIMINGS
+        }))
     
     print(f"\n{Colors.GREEN}Detailed report saved to: {report_file}{Colors.RESET}\n")
 
@@ -397,6 +734,5 @@ if __name__ == "__main__":
         sys.exit(0)
     except Exception as e:
         print(f"\n{Colors.RED}Fatal error: {e}{Colors.RESET}")
-        import traceback
         traceback.print_exc()
         sys.exit(1)